@@ -0,0 +1,40 @@
+"""
+Add product shop and generic index
+
+Revision ID: 3b9d41f0c5a8
+Revises: e72062e7d02e
+Create Date: 2026-10-16 09:12:47.203915
+"""
+# pylint: disable=invalid-name
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "3b9d41f0c5a8"
+down_revision: str | None = "e72062e7d02e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """
+    Perform the upgrade.
+    """
+
+    with op.batch_alter_table("product", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_product_shop_generic_id",
+            ["shop", "generic_id", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """
+    Perform the downgrade.
+    """
+
+    with op.batch_alter_table("product", schema=None) as batch_op:
+        batch_op.drop_index("ix_product_shop_generic_id")
@@ -0,0 +1,80 @@
+"""
+Add foreign key indexes
+
+Revision ID: c4e8a27b91d3
+Revises: 3b9d41f0c5a8
+Create Date: 2026-10-16 10:03:21.648217
+"""
+# pylint: disable=invalid-name
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "c4e8a27b91d3"
+down_revision: str | None = "3b9d41f0c5a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """
+    Perform the upgrade.
+    """
+
+    with op.batch_alter_table(
+        "receipt_discount_products", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_receipt_discount_products_product",
+            ["product_id"],
+            unique=False,
+        )
+
+    with op.batch_alter_table("receipt_product", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_receipt_product_receipt_position",
+            ["receipt_key", "position"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_receipt_product_product", ["product_id"], unique=False
+        )
+
+    with op.batch_alter_table("receipt_discount", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_receipt_discount_receipt_position",
+            ["receipt_key", "position"],
+            unique=False,
+        )
+
+    with op.batch_alter_table(
+        "shop_discount_indicator", schema=None
+    ) as batch_op:
+        batch_op.create_index(
+            "ix_shop_discount_indicator_shop", ["shop_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """
+    Perform the downgrade.
+    """
+
+    with op.batch_alter_table(
+        "shop_discount_indicator", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_shop_discount_indicator_shop")
+
+    with op.batch_alter_table("receipt_discount", schema=None) as batch_op:
+        batch_op.drop_index("ix_receipt_discount_receipt_position")
+
+    with op.batch_alter_table("receipt_product", schema=None) as batch_op:
+        batch_op.drop_index("ix_receipt_product_product")
+        batch_op.drop_index("ix_receipt_product_receipt_position")
+
+    with op.batch_alter_table(
+        "receipt_discount_products", schema=None
+    ) as batch_op:
+        batch_op.drop_index("ix_receipt_discount_products_product")
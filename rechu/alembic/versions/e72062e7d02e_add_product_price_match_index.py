@@ -0,0 +1,40 @@
+"""
+Add product price match index
+
+Revision ID: e72062e7d02e
+Revises: 720350314f42
+Create Date: 2026-10-15 20:41:12.518306
+"""
+# pylint: disable=invalid-name
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# Revision identifiers, used by Alembic.
+revision: str = "e72062e7d02e"
+down_revision: str | None = "720350314f42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """
+    Perform the upgrade.
+    """
+
+    with op.batch_alter_table("product_price_match", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_product_price_match_product_indicator",
+            ["product_id", "indicator"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """
+    Perform the downgrade.
+    """
+
+    with op.batch_alter_table("product_price_match", schema=None) as batch_op:
+        batch_op.drop_index("ix_product_price_match_product_indicator")
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import ClassVar, TypeVar, final
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing_extensions import override
 
 from ..database import Database
@@ -16,6 +16,7 @@ from ..inventory.shops import Shops
 from ..io.base import Writer
 from ..io.receipt import ReceiptWriter
 from ..models import Base as ModelBase, Receipt
+from ..models.receipt import Discount
 from .base import Base, SubparserArguments, SubparserKeywords
 
 T = TypeVar("T", bound=ModelBase)
@@ -89,7 +90,11 @@ class Dump(Base):
     def _write_receipts(self, session: Session, files: list[str]) -> None:
         data_format = self.settings.get("data", "format")
 
-        receipts = select(Receipt)
+        # Load items of all receipts in bulk rather than for each receipt
+        receipts = select(Receipt).options(
+            selectinload(Receipt.products),
+            selectinload(Receipt.discounts).selectinload(Discount.items),
+        )
         if self.files:
             receipts = receipts.where(Receipt.filename.in_(files))
         for receipt in session.scalars(receipts):
@@ -19,6 +19,8 @@ from sqlalchemy.pool import ConnectionPoolEntry
 from .models import Base
 from .settings import Settings
 
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+
 
 class Database:
     """
@@ -43,8 +45,14 @@ class Database:
             if settings.get("database", "foreign_keys").lower() == "off"
             else "ON"
         )
+        journal_mode = settings.get("database", "journal_mode").upper()
         cursor = connection.cursor()
         cursor.execute(f"PRAGMA foreign_keys = {pragma_value}")
+        if journal_mode in _JOURNAL_MODES:
+            cursor.execute(f"PRAGMA journal_mode = {journal_mode}")
+            # Write-ahead logging remains durable without full synchronization
+            if journal_mode == "WAL":
+                cursor.execute("PRAGMA synchronous = NORMAL")
         cursor.close()
 
     def create_schema(self) -> None:
@@ -53,11 +61,10 @@ class Database:
         using alembic's stamp command.
         """
 
-        Base.metadata.create_all(self.engine)
-
         alembic_config = self.get_alembic_config()
         directory = script.ScriptDirectory.from_config(alembic_config)
         with self.engine.begin() as connection:
+            Base.metadata.create_all(connection)
             migration_context = MigrationContext.configure(connection)
             migration_context.stamp(directory, "head")
 
@@ -23,6 +23,8 @@ class Inventory(Mapping[Path, list[T]], metaclass=ABCMeta):
     which are concretized in file names.
     """
 
+    __slots__: tuple[str, ...] = ()
+
     @classmethod
     @abstractmethod
     def spread(cls, models: Iterable[T]) -> "Inventory[T]":
@@ -8,7 +8,7 @@ import re
 from collections.abc import Hashable, Iterable, Iterator
 from pathlib import Path
 from string import Formatter
-from typing import TYPE_CHECKING, cast, final
+from typing import TYPE_CHECKING, ClassVar, cast, final
 
 from sqlalchemy import select
 from sqlalchemy.orm import MappedColumn, Session
@@ -32,6 +32,8 @@ else:
 
 LOGGER = logging.getLogger(__name__)
 
+_Parts = tuple[str, str, SharedFields, re.Pattern[str]]
+
 
 @final
 class Products(Inventory[Product], dict[Path, list[Product]]):
@@ -43,6 +45,9 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
     __iter__ = dict[Path, list[Product]].__iter__
     __len__ = dict[Path, list[Product]].__len__
     __hash__ = dict[Path, list[Product]].__hash__
+    __slots__ = ("_map_filled", "_matcher", "_parts")
+
+    _parts_cache: ClassVar[dict[str, _Parts]] = {}
 
     def __init__(
         self,
@@ -58,18 +63,27 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
             parts = self.get_parts(settings)[2]
         self._parts = set(parts)
         self._matcher = ProductMatcher()
+        self._map_filled = False
 
-    @staticmethod
-    def get_parts(
-        settings: Settings,
-    ) -> tuple[str, str, SharedFields, re.Pattern[str]]:
+    @classmethod
+    def get_parts(cls, settings: Settings) -> _Parts:
         """
         Retrieve various formatting, selecting and matching parts for inventory
         filenames of products.
+
+        The parts are cached per products path format, such that repeated
+        inventory operations do not parse the format or compile the pattern.
         """
 
-        formatter = Formatter()
         path_format = settings.get("data", "products")
+        if path_format not in cls._parts_cache:
+            cls._parts_cache[path_format] = cls._make_parts(path_format)
+
+        return cls._parts_cache[path_format]
+
+    @staticmethod
+    def _make_parts(path_format: str) -> _Parts:
+        formatter = Formatter()
         prefixes: list[str] = []
         keys: list[str | None] = []
         for prefix, key, _, _ in formatter.parse(path_format):
@@ -88,20 +102,28 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
         pattern = re.compile(rf"(^|.*/){path}$")
         return path_format, glob_pattern, fields, pattern
 
+    @classmethod
+    def _get_settings_parts(cls) -> tuple[Path, _Parts]:
+        settings = Settings.get_settings()
+        return Path(settings.get("data", "path")), cls.get_parts(settings)
+
     @override
     @classmethod
     def spread(cls, models: Iterable[Product]) -> "Inventory[Product]":
         inventory: dict[Path, list[Product]] = {}
-        settings = Settings.get_settings()
-        data_path = settings.get("data", "path")
-        path_format, _, parts, _ = cls.get_parts(settings)
+        data_path, (path_format, _, parts, _) = cls._get_settings_parts()
+        paths: dict[tuple[str | None, ...], Path] = {}
         for model in models:
-            fields = {
-                str(part): cast(str | None, getattr(model, part))
-                for part in parts
-            }
-            path = data_path / Path(path_format.format(**fields))
-            inventory.setdefault(path.resolve(), []).append(model)
+            values = tuple(
+                cast(str | None, getattr(model, part)) for part in parts
+            )
+            if values not in paths:
+                fields: dict[str, str | None] = dict(
+                    zip(parts, values, strict=True)
+                )
+                path = data_path / path_format.format_map(fields)
+                paths[values] = path.resolve()
+            inventory.setdefault(paths[values], []).append(model)
 
         return cls(inventory, parts=parts)
 
@@ -111,9 +133,7 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
         cls, session: Session, selectors: Selectors | None = None
     ) -> "Inventory[Product]":
         inventory: dict[Path, list[Product]] = {}
-        settings = Settings.get_settings()
-        data_path = settings.get("data", "path")
-        path_format, _, parts, _ = cls.get_parts(settings)
+        data_path, (path_format, _, parts, _) = cls._get_settings_parts()
         if not parts:
             selectors = [{}]
         elif not selectors:
@@ -135,7 +155,7 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
                 .filter(Product.generic_id.is_(None))
                 .filter_by(**fields)
             ).all()
-            path = data_path / Path(path_format.format(**fields))
+            path = data_path / path_format.format_map(fields)
             inventory[path.resolve()] = list(products)
 
         return cls(inventory, parts=parts)
@@ -144,10 +164,12 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
     @classmethod
     def read(cls, selectors: Selectors | None = None) -> "Inventory[Product]":
         inventory: dict[Path, list[Product]] = {}
-        settings = Settings.get_settings()
-        data_path = Path(settings.get("data", "path"))
-        _, glob_pattern, parts, pattern = cls.get_parts(settings)
-        for path in sorted(data_path.glob(glob_pattern)):
+        data_path, (_, glob_pattern, parts, pattern) = cls._get_settings_parts()
+        # Enumerate relative names with the glob module to avoid allocating
+        # path objects for every candidate entry in the data directory.
+        names = glob.iglob(glob_pattern, root_dir=data_path)  # noqa: PTH207
+        for name in sorted(names):
+            path = data_path / name
             if cls.filter_path(path, pattern, selectors):
                 LOGGER.info("Looking at products in %s", path)
                 try:
@@ -210,9 +232,12 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
         only_new: bool = False,
     ) -> "Inventory[Product]":
         updated: dict[Path, list[Product]] = {}
-        self._matcher.fill_map(self)
+        if not self._map_filled:
+            self._matcher.fill_map(self)
+            self._map_filled = True
         if only_new:
             update = False
+        mapped: list[Product] = []
         for path, products in other.items():
             changed = False
             updates: list[Product] = []
@@ -225,6 +250,7 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
                     updates.append(match)
 
             if update:
+                mapped.extend(updates)
                 previous = list(self.get(path, []))
                 self[path] = previous + [
                     change for change in updates if change not in previous
@@ -234,11 +260,16 @@ class Products(Inventory[Product], dict[Path, list[Product]]):
             if changed:
                 updated[path] = updates
 
+        # Keep the map up to date with new and merged products only
+        for product in mapped:
+            _ = self._matcher.add_map(product)
+
         return Products(updated, parts=self._parts)
 
     @override
     def find(self, key: Hashable, update_map: bool = False) -> Product:
         if update_map:
             self._matcher.fill_map(self)
+            self._map_filled = True
 
         return self._matcher.find_map(key)
@@ -34,6 +34,7 @@ class Shops(Inventory[Shop], dict[Path, list[Shop]]):
     __iter__ = dict[Path, list[Shop]].__iter__
     __len__ = dict[Path, list[Shop]].__len__
     __hash__ = dict[Path, list[Shop]].__hash__
+    __slots__ = ("_map",)
 
     def __init__(
         self,
@@ -45,9 +46,11 @@ class Shops(Inventory[Shop], dict[Path, list[Shop]]):
             self.update(mapping)
         self._update_map()
 
-    def _update_map(self) -> None:
+    def _update_map(self, path: Path | None = None) -> None:
+        if path is None:
+            path = self._get_path()
         self._map: dict[Hashable, Shop] = {
-            shop.key: shop for shop in self.get(self._get_path(), [])
+            shop.key: shop for shop in self.get(path, [])
         }
 
     @staticmethod
@@ -94,6 +97,15 @@ class Shops(Inventory[Shop], dict[Path, list[Shop]]):
         if path in self:
             yield ShopsWriter(path, self[path])
 
+    def _add_shops(self, path: Path, updates: list[Shop]) -> list[Shop]:
+        # Keep the map in sync with the new shops instead of rebuilding it
+        current = self.setdefault(path, [])
+        for change in updates:
+            if change.key not in self._map:
+                self._map[change.key] = change
+                current.append(change)
+        return current.copy()
+
     @override
     def merge_update(
         self,
@@ -106,7 +118,7 @@ class Shops(Inventory[Shop], dict[Path, list[Shop]]):
         if only_new:
             update = False
 
-        self._update_map()
+        self._update_map(path)
         changed = False
         for shop in other.get(path, []):
             existing = self._map.get(shop.key)
@@ -123,11 +135,7 @@ class Shops(Inventory[Shop], dict[Path, list[Shop]]):
             updates.append(existing)
 
         if update:
-            previous = list(self.get(path, []))
-            self[path] = previous + [
-                change for change in updates if change not in previous
-            ]
-            updates = self[path].copy()
+            updates = self._add_shops(path, updates)
 
         if not changed:
             return Shops()
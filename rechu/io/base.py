@@ -5,13 +5,18 @@ Abstract base classes for file reading, writing and parsing.
 import logging
 import os
 import re
+import shutil
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from collections.abc import Collection, Iterator
 from datetime import datetime
 from enum import Enum
+from io import StringIO
 from pathlib import Path
+from secrets import token_hex
 from typing import (
     cast,
+    ClassVar,
     Generic,
     get_origin,
     TextIO,
@@ -27,9 +32,15 @@ from rechu.models.base import Base, GTIN, Price, Quantity
 
 if TYPE_CHECKING:
     from _typeshed import OpenTextModeReading, OpenTextModeWriting
+    from yaml import SafeDumper, SafeLoader
 else:
     OpenTextModeReading = str
     OpenTextModeWriting = str
+    # Use the faster libyaml bindings if available
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +48,9 @@ LOGGER = logging.getLogger(__name__)
 T = TypeVar("T", bound=Base)
 # Representation of model in serializable form
 RT = TypeVar("RT")
+# Identification of an unchanged file: path, modification and change times
+# in nanoseconds and size
+_FileKey = tuple[Path, int, int, int]
 
 
 class Reader(Generic[T], metaclass=ABCMeta):
@@ -85,6 +99,53 @@ class YAMLReader(Reader[T], metaclass=ABCMeta):
     YAML file reader.
     """
 
+    _cacheable: ClassVar[bool] = False
+    _cache: ClassVar[OrderedDict[_FileKey, object]] = OrderedDict()
+    _cache_size: ClassVar[int] = 256
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Remove the loaded data of files that readers keep for reuse.
+        """
+
+        cls._cache.clear()
+
+    def _get_cache_key(self, file: TextIO) -> _FileKey | None:
+        if not self._cacheable:
+            return None
+        try:
+            status = os.fstat(file.fileno())
+        except (OSError, ValueError):
+            return None
+        return (
+            self._path,
+            status.st_mtime_ns,
+            status.st_ctime_ns,
+            status.st_size,
+        )
+
+    def _load_cached(self, file: TextIO) -> object:
+        # Reuse loaded data of unchanged files for readers of metadata that is
+        # read repeatedly, which the parsers do not alter; models are still
+        # created anew from it.
+        key = self._get_cache_key(file)
+
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Provide the entire contents at once such that libyaml can scan it
+        # as a buffer instead of through repeated read callbacks
+        data: object = yaml.load(  # pyright: ignore[reportAny]
+            file.read(), Loader=SafeLoader
+        )
+        if key is not None:
+            self._cache[key] = data
+            if len(self._cache) > self._cache_size:
+                _ = self._cache.popitem(last=False)
+        return data
+
     def load(self, file: TextIO, expected: type[RT]) -> RT:
         """
         Load the YAML file as a Python value.
@@ -100,7 +161,7 @@ class YAMLReader(Reader[T], metaclass=ABCMeta):
                     "Expected typing annotations for load, got %r", expected
                 )
 
-            data = yaml.safe_load(file)  # pyright: ignore[reportAny]
+            data = self._load_cached(file)
             if isinstance(data, expected):
                 return data
             raise TypeError(f"File '{self.path}' does not contain {expected}")
@@ -139,10 +200,30 @@ class Writer(Generic[T], metaclass=ABCMeta):
     def write(self) -> None:
         """
         Write the models to the path.
+
+        The serialized models are collected in memory and written to a
+        temporary file in one go, which then replaces the file at the path,
+        such that a failure during serialization leaves the file intact.
+        Symbolic links are followed and the permissions of an existing file
+        are kept, but replacing the file breaks its hard links and resets its
+        ownership to the current user.
         """
 
-        with self._path.open(self._mode, encoding=self._encoding) as file:
-            self.serialize(file)
+        buffer = StringIO()
+        self.serialize(buffer)
+        target = self._path.resolve()
+        descriptor, temp_path = self._create_temporary(target)
+        try:
+            with os.fdopen(
+                descriptor, self._mode, encoding=self._encoding
+            ) as file:
+                _ = file.write(buffer.getvalue())
+            if target.exists():
+                shutil.copymode(target, temp_path)
+            _ = temp_path.replace(target)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
         if self._updated is not None:
             os.utime(
@@ -150,6 +231,20 @@ class Writer(Generic[T], metaclass=ABCMeta):
                 times=(self._updated.timestamp(), self._updated.timestamp()),
             )
 
+    @staticmethod
+    def _create_temporary(target: Path) -> tuple[int, Path]:
+        # Create a new file with a random name next to the target, with the
+        # permissions for new files applied from the umask
+        while True:
+            temp_path = target.with_name(f".{target.name}.{token_hex(8)}.tmp")
+            try:
+                descriptor = os.open(
+                    temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+                )
+            except FileExistsError:
+                continue
+            return descriptor, temp_path
+
     @abstractmethod
     def serialize(self, file: TextIO) -> None:
         """
@@ -169,41 +264,49 @@ class YAMLTag(str, Enum):
     STR = "tag:yaml.org,2002:str"
 
 
-class YAMLWriter(Writer[T], Generic[T, RT], metaclass=ABCMeta):
+def _represent_gtin(dumper: SafeDumper, data: GTIN) -> yaml.Node:
+    return dumper.represent_scalar(YAMLTag.INT.value, f"{data:0>14}")
+
+
+def _represent_price(dumper: SafeDumper, data: Price) -> yaml.Node:
+    return dumper.represent_scalar(YAMLTag.FLOAT.value, str(data))
+
+
+def _represent_quantity(dumper: SafeDumper, data: Quantity) -> yaml.Node:
+    if data.unit:
+        return dumper.represent_scalar(YAMLTag.STR.value, str(data))
+    return dumper.represent_scalar(YAMLTag.INT.value, str(int(data)))
+
+
+class YAMLDumper(SafeDumper):
+    # pylint: disable=too-many-ancestors
     """
-    YAML file writer.
+    YAML dumper with representers for model field types.
     """
 
-    @classmethod
-    def _represent_gtin(cls, dumper: yaml.Dumper, data: GTIN) -> yaml.Node:
-        return dumper.represent_scalar(YAMLTag.INT, f"{data:0>14}")
 
-    @classmethod
-    def _represent_price(cls, dumper: yaml.Dumper, data: Price) -> yaml.Node:
-        return dumper.represent_scalar(YAMLTag.FLOAT, str(data))
+YAMLDumper.add_implicit_resolver(
+    YAMLTag.INT.value, re.compile(r"^\d{14}$"), list("0123456789")
+)
+YAMLDumper.add_representer(GTIN, _represent_gtin)
+YAMLDumper.add_representer(Price, _represent_price)
+YAMLDumper.add_representer(Quantity, _represent_quantity)
 
-    @classmethod
-    def _represent_quantity(
-        cls, dumper: yaml.Dumper, data: Quantity
-    ) -> yaml.Node:
-        if data.unit:
-            return dumper.represent_scalar(YAMLTag.STR, str(data))
-        return dumper.represent_scalar(YAMLTag.INT, str(int(data)))
+
+class YAMLWriter(Writer[T], Generic[T, RT], metaclass=ABCMeta):
+    """
+    YAML file writer.
+    """
 
     def save(self, data: RT, file: TextIO) -> None:
         """
         Save the YAML file from a Python value.
         """
 
-        yaml.add_implicit_resolver(
-            YAMLTag.INT, re.compile(r"^\d{14}$"), list("0123456789")
-        )
-        yaml.add_representer(GTIN, self._represent_gtin)
-        yaml.add_representer(Price, self._represent_price)
-        yaml.add_representer(Quantity, self._represent_quantity)
         yaml.dump(
             data,
             file,
+            Dumper=YAMLDumper,
             width=80,
             indent=2,
             default_flow_style=None,
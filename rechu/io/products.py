@@ -4,10 +4,12 @@ Products matching metadata file handling.
 
 from collections.abc import Collection, Iterable, Iterator
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import (
     Any,
     cast,
+    ClassVar,
     final,
     get_args,
     Literal,
@@ -76,6 +78,14 @@ SHARED_FIELDS: tuple[ShareableField, ...] = get_args(ShareableField)
 PROPERTY_FIELDS: tuple[PropertyField, ...] = get_args(PropertyField)
 IDENTIFIER_FIELDS: tuple[IdentifierField, ...] = get_args(IdentifierField)
 OPTIONAL_FIELDS: tuple[OptionalField, ...] = get_args(OptionalField)
+_get_name: "attrgetter[str]" = attrgetter("name")
+_get_label: "attrgetter[str]" = attrgetter("label")
+_get_properties: "attrgetter[tuple[Any | None, ...]]" = attrgetter(
+    *PROPERTY_FIELDS
+)
+_get_identifiers: "attrgetter[tuple[Any | None, ...]]" = attrgetter(
+    *IDENTIFIER_FIELDS
+)
 
 
 @final
@@ -84,6 +94,8 @@ class ProductsReader(YAMLReader[Product]):
     File reader for products metadata.
     """
 
+    _cacheable: ClassVar[bool] = True
+
     @override
     def parse(self, file: TextIO) -> Iterator[Product]:
         data = self.load(file, _InventoryGroup)
@@ -108,6 +120,17 @@ class ProductsReader(YAMLReader[Product]):
 
         return output_value
 
+    @staticmethod
+    def _get_prices(prices: list[Price] | dict[str, Price]) -> list[PriceMatch]:
+        if isinstance(prices, list):
+            return [PriceMatch(value=value) for value in map(Price, prices)]
+
+        values = map(Price, prices.values())
+        return [
+            PriceMatch(value=value, indicator=key)
+            for key, value in zip(prices.keys(), values, strict=True)
+        ]
+
     def _product(
         self, data: _InventoryGroup, generic: _GenericProduct, meta: _Product
     ) -> Product:
@@ -116,8 +139,19 @@ class ProductsReader(YAMLReader[Product]):
         shop = data.get("shop", generic.get("shop", meta.get("shop")))
         if shop is None:
             raise TypeError("A shop must be provided for product")
-        product = Product(
+        return Product(
             shop=shop,
+            labels=[
+                LabelMatch(name=name)
+                for name in meta.get("labels", generic.get("labels", []))
+            ],
+            prices=self._get_prices(
+                meta.get("prices", generic.get("prices", []))
+            ),
+            discounts=[
+                DiscountMatch(label=label)
+                for label in meta.get("bonuses", generic.get("bonuses", []))
+            ],
             brand=meta.get("brand", generic.get("brand")),
             description=meta.get("description", generic.get("description")),
             category=meta.get(
@@ -138,27 +172,6 @@ class ProductsReader(YAMLReader[Product]):
             gtin=GTIN(meta["gtin"]) if "gtin" in meta else None,
         )
 
-        product.labels = [
-            LabelMatch(name=name)
-            for name in meta.get("labels", generic.get("labels", []))
-        ]
-        prices = meta.get("prices", generic.get("prices", []))
-        if isinstance(prices, list):
-            product.prices = [
-                PriceMatch(value=Price(price)) for price in prices
-            ]
-        else:
-            product.prices = [
-                PriceMatch(value=Price(price), indicator=key)
-                for key, price in prices.items()
-            ]
-        product.discounts = [
-            DiscountMatch(label=label)
-            for label in meta.get("bonuses", generic.get("bonuses", []))
-        ]
-
-        return product
-
 
 @final
 class ProductsWriter(YAMLWriter[Product, _InventoryGroup]):
@@ -204,7 +217,7 @@ class ProductsWriter(YAMLWriter[Product, _InventoryGroup]):
         if "shop" not in skip_fields:
             data["shop"] = product.shop
 
-        labels = [label.name for label in product.labels]
+        labels = list(map(_get_name, product.labels))
         if labels != generic.get("labels", []):
             data["labels"] = labels
 
@@ -212,17 +225,18 @@ class ProductsWriter(YAMLWriter[Product, _InventoryGroup]):
         if prices != generic.get("prices", []):
             data["prices"] = prices
 
-        discounts = [discount.label for discount in product.discounts]
+        discounts = list(map(_get_label, product.discounts))
         if discounts != generic.get("bonuses", []):
             data["bonuses"] = discounts
 
-        for field in PROPERTY_FIELDS:
-            if field not in skip_fields:
-                value = getattr(product, field, None)
-                if value != generic.get(field):
-                    data[field] = value
-        for id_field in IDENTIFIER_FIELDS:
-            identifier = getattr(product, id_field, None)
+        for field, value in zip(
+            PROPERTY_FIELDS, _get_properties(product), strict=True
+        ):
+            if field not in skip_fields and value != generic.get(field):
+                data[field] = value
+        for id_field, identifier in zip(
+            IDENTIFIER_FIELDS, _get_identifiers(product), strict=True
+        ):
             if identifier is not None:
                 data[id_field] = identifier
 
@@ -247,20 +261,33 @@ class ProductsWriter(YAMLWriter[Product, _InventoryGroup]):
 
         return data
 
+    def _get_common(self) -> dict[ShareableField, str | None]:
+        # Find shared fields with the same value in all products in one pass,
+        # stopping early once every field has a differing value
+        common: dict[ShareableField, str | None] = {}
+        fields = set(self._shared_fields)
+        for index, product in enumerate(self._models):
+            if not fields:
+                break
+            for shared in tuple(fields):
+                value = cast(str | None, getattr(product, shared))
+                if index == 0:
+                    common[shared] = value
+                elif common[shared] != value:
+                    fields.discard(shared)
+                    del common[shared]
+
+        return common
+
     @override
     def serialize(self, file: TextIO) -> None:
         group: _InventoryGroup = {}
         skip_fields: set[Field] = set()
+        common = self._get_common()
         for shared in self._shared_fields:
-            values: set[str] = {
-                getattr(product, shared) for product in self._models
-            }
-            try:
-                common = values.pop()
-            except KeyError:
-                common = None
-            if not values and common is not None:
-                group[shared] = str(common)
+            value = common.get(shared)
+            if value is not None:
+                group[shared] = value
                 skip_fields.add(shared)
             elif shared == "shop":
                 raise ValueError("Not all products are from the same shop")
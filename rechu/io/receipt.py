@@ -2,10 +2,13 @@
 Receipt file handling.
 """
 
+from bisect import bisect_left
 from collections.abc import Collection, Iterator
 from datetime import date, datetime
 from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
+from sys import intern
 from typing import final, TextIO
 
 from typing_extensions import override, Required, TypedDict
@@ -16,6 +19,9 @@ from .base import YAMLReader, YAMLWriter
 
 _ProductItem = list[str | float | Price | Quantity]
 _Discount = list[str | Price]
+_get_label: "attrgetter[str]" = attrgetter("label")
+# Positions of product items with discount indicators by their label
+_DiscountIndex = dict[str, list[int]]
 
 
 class _Receipt(TypedDict, total=False):
@@ -45,8 +51,12 @@ class ReceiptReader(YAMLReader[Receipt]):
                 self._product(position, item)
                 for position, item in enumerate(data["products"])
             ]
+            index: _DiscountIndex = {}
+            for position, product in enumerate(receipt.products):
+                if product.discount_indicator:
+                    index.setdefault(product.label, []).append(position)
             receipt.discounts = [
-                self._discount(position, item, receipt.products)
+                self._discount(position, item, receipt.products, index)
                 for position, item in enumerate(data.get("bonus", []))
             ]
         except KeyError as error:
@@ -61,10 +71,12 @@ class ReceiptReader(YAMLReader[Receipt]):
         quantity = Quantity(item[0])
         if not isinstance(item[2], (str, float, Decimal)):
             raise TypeError(f"Price '{item[2]!r}' could not be converted")
-        discount_indicator = str(item[3]) if len(item) > 3 else None
+        # Labels and indicators repeat across items and discounts of receipts,
+        # so share one string object for each distinct value
+        discount_indicator = intern(str(item[3])) if len(item) > 3 else None
         return ProductItem(
             quantity=quantity,
-            label=str(item[1]),
+            label=intern(str(item[1])),
             price=Price(item[2]),
             discount_indicator=discount_indicator,
             position=position,
@@ -73,20 +85,27 @@ class ReceiptReader(YAMLReader[Receipt]):
         )
 
     def _discount(
-        self, position: int, item: _Discount, products: list[ProductItem]
+        self,
+        position: int,
+        item: _Discount,
+        products: list[ProductItem],
+        index: _DiscountIndex,
     ) -> Discount:
         if len(item) < 2:
             raise TypeError(f"Discount has too few elements: {len(item)}")
         discount = Discount(
-            label=str(item[0]), price_decrease=Price(item[1]), position=position
+            label=intern(str(item[0])),
+            price_decrease=Price(item[1]),
+            position=position,
         )
         seen = 0
         for label in item[2:]:
-            for index, product in enumerate(products[seen:]):
-                if product.discount_indicator and label == product.label:
-                    discount.items.append(product)
-                    seen += index + 1
-                    break
+            # Find the first product with the label after the previous one
+            positions = index.get(label, []) if isinstance(label, str) else []
+            found = bisect_left(positions, seen)
+            if found < len(positions):
+                discount.items.append(products[positions[found]])
+                seen = positions[found] + 1
         return discount
 
 
@@ -122,7 +141,7 @@ class ReceiptWriter(YAMLWriter[Receipt, _Receipt]):
             discount.label,
             discount.price_decrease,
         ]
-        data.extend([item.label for item in discount.items])
+        data.extend(map(_get_label, discount.items))
         return data
 
     @override
@@ -130,11 +149,7 @@ class ReceiptWriter(YAMLWriter[Receipt, _Receipt]):
         data: _Receipt = {
             "date": self._model.date,
             "shop": self._model.shop,
-            "products": [
-                self._get_product(product) for product in self._model.products
-            ],
-            "bonus": [
-                self._get_discount(bonus) for bonus in self._model.discounts
-            ],
+            "products": list(map(self._get_product, self._model.products)),
+            "bonus": list(map(self._get_discount, self._model.discounts)),
         }
         self.save(data, file)
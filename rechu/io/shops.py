@@ -3,7 +3,8 @@ Shops metadata file handling.
 """
 
 from collections.abc import Iterator
-from typing import final, get_args, Literal, TextIO
+from operator import attrgetter
+from typing import ClassVar, final, get_args, Literal, TextIO
 
 from typing_extensions import override, Required, TypedDict
 
@@ -26,6 +27,10 @@ class _Shop(TypedDict, total=False):
 
 OptionalField = Literal["name", "website", "wikidata", "products"]
 OPTIONAL_FIELDS: tuple[OptionalField, ...] = get_args(OptionalField)
+_get_pattern: "attrgetter[str]" = attrgetter("pattern")
+_get_optional: "attrgetter[tuple[str | None, ...]]" = attrgetter(
+    *OPTIONAL_FIELDS
+)
 
 
 @final
@@ -34,6 +39,8 @@ class ShopsReader(YAMLReader[Shop]):
     File reader for shops metadata.
     """
 
+    _cacheable: ClassVar[bool] = True
+
     @override
     def parse(self, file: TextIO) -> Iterator[Shop]:
         data = self.load(file, list[_Shop])
@@ -69,16 +76,17 @@ class ShopsWriter(YAMLWriter[Shop, list[_Shop]]):
 
     def _shop(self, shop: Shop) -> _Shop:
         data: _Shop = {"key": shop.key}
-        for field in OPTIONAL_FIELDS:
-            if (value := getattr(shop, field, None)) is not None:
+        for field, value in zip(
+            OPTIONAL_FIELDS, _get_optional(shop), strict=True
+        ):
+            if value is not None:
                 data[field] = value
-        if shop.discount_indicators:
-            data["discount_indicators"] = [
-                indicator.pattern for indicator in shop.discount_indicators
-            ]
+        indicators = shop.discount_indicators
+        if indicators:
+            data["discount_indicators"] = list(map(_get_pattern, indicators))
         return data
 
     @override
     def serialize(self, file: TextIO) -> None:
-        data = [self._shop(shop) for shop in self._models]
+        data = list(map(self._shop, self._models))
         self.save(data, file)
@@ -2,7 +2,6 @@
 Database entity matching methods.
 """
 
-import logging
 from abc import ABCMeta, abstractmethod
 from collections.abc import Collection, Hashable, Iterable, Iterator, Sequence
 from typing import Generic, TypeVar
@@ -15,8 +14,6 @@ from ..models.base import Base as ModelBase
 IT = TypeVar("IT", bound=ModelBase)
 CT = TypeVar("CT", bound=ModelBase)
 
-LOGGER = logging.getLogger(__name__)
-
 
 class Matcher(Generic[IT, CT], metaclass=ABCMeta):
     """
@@ -25,6 +22,8 @@ class Matcher(Generic[IT, CT], metaclass=ABCMeta):
 
     def __init__(self) -> None:
         self._map: dict[Hashable, CT] | None = None
+        # Keys stored in the map for each candidate model by its identity
+        self._keys: dict[int, set[Hashable]] = {}
 
     @abstractmethod
     def find_candidates(
@@ -117,6 +116,7 @@ class Matcher(Generic[IT, CT], metaclass=ABCMeta):
         """
 
         self._map = {}
+        self._keys = {}
         for candidate in self.select_candidates(session):
             _ = self.add_map(candidate)
 
@@ -127,6 +127,7 @@ class Matcher(Generic[IT, CT], metaclass=ABCMeta):
         """
 
         self._map = {}
+        self._keys = {}
 
     def fill_map(self, inventory: Inventory[CT]) -> None:
         """
@@ -151,8 +152,13 @@ class Matcher(Generic[IT, CT], metaclass=ABCMeta):
             return False
 
         add = False
+        keys = self._keys.setdefault(id(candidate), set())
         for key in self.get_keys(candidate):
-            add = self._map.setdefault(key, candidate) is candidate or add
+            if self._map.setdefault(key, candidate) is candidate:
+                keys.add(key)
+                add = True
+        if not keys:
+            del self._keys[id(candidate)]
 
         return add
 
@@ -165,21 +171,13 @@ class Matcher(Generic[IT, CT], metaclass=ABCMeta):
         if self._map is None:
             return False
 
-        remove = False
-        for key in self.get_keys(candidate):
-            found = self._map.pop(key, None)
-            if found is candidate:
-                remove = True
-            elif found is not None:
-                LOGGER.warning(
-                    "Candidate instance stored at %r is not %r: %r",
-                    key,
-                    candidate,
-                    found,
-                )
-                self._map[key] = found
-
-        return remove
+        # Remove the keys under which the candidate was stored, even if its
+        # fields changed since, without determining its keys again
+        keys = self._keys.pop(id(candidate), set())
+        for key in keys:
+            del self._map[key]
+
+        return bool(keys)
 
     def check_map(self, candidate: CT) -> CT | None:
         """
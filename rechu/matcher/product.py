@@ -2,30 +2,36 @@
 Product metadata matcher.
 """
 
+import heapq
 import logging
 import re
 from collections.abc import (
     Collection,
     Hashable,
+    Iterable,
     Iterator,
     Sequence,
     Set as AbstractSet,
 )
+from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import TypeVar, cast
+from itertools import chain
+from typing import ClassVar, TypeVar, cast
 
 from sqlalchemy import (
+    ColumnElement,
     Row,
     Select,
     String,
     and_,
+    bindparam,
     cast as cast_,
     literal,
     or_,
     select,
 )
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm import Session, aliased, contains_eager, selectinload
 from sqlalchemy.sql.expression import extract
 from sqlalchemy.sql.functions import coalesce, concat
 from typing_extensions import override
@@ -68,6 +74,11 @@ class _CandidateRow(Row[_Row]):
 
 
 _MAP_KEYS = frozenset({MapKey.MAP_MATCH, MapKey.MAP_SKU, MapKey.MAP_GTIN})
+# Order in which keys are generated, with cheap identifiers first
+_MAP_KEY_ORDER = (MapKey.MAP_SKU, MapKey.MAP_GTIN, MapKey.MAP_MATCH)
+# Plain string values of interval indicators for fast comparisons
+_MINIMUM = Indicator.MINIMUM.value
+_MAXIMUM = Indicator.MAXIMUM.value
 MapMatch = (
     tuple[str, str | GTIN | None]
     | tuple[
@@ -78,6 +89,15 @@ MapMatch = (
     ]
 )
 Key = tuple[MapKey, MapMatch]
+# Candidate products in query order by their shop and fixed label name, or None
+# for products without labels or with label patterns
+_Buckets = dict[tuple[str, str | None], list[tuple[int, Product]]]
+# Shape of a candidate query: whether it has items, extra candidates, only
+# unmatched items, discount matching and items from a single shop
+_QueryShape = tuple[bool, bool, bool, bool, bool]
+_Parameters = dict[str, list[int] | str]
+# Maximum number of item IDs to provide to a single candidate query
+_ITEM_BATCH_SIZE = 500
 
 
 class ProductMatcher(Matcher[ProductItem, Product]):
@@ -85,10 +105,16 @@ class ProductMatcher(Matcher[ProductItem, Product]):
     Matcher for receipt product items and product metadata.
     """
 
+    _queries: ClassVar[dict[_QueryShape, Select[_Row]]] = {}
+    _unit_prices: ClassVar[dict[tuple[Price, str | None], Quantity | None]] = {}
+    _dates: ClassVar[dict[date, tuple[str, str]]] = {}
+
     def __init__(self, map_keys: AbstractSet[MapKey] = _MAP_KEYS) -> None:
         super().__init__()
         self.discounts: bool = True
-        self._map_keys: AbstractSet[MapKey] = map_keys
+        self._map_keys: tuple[MapKey, ...] = tuple(
+            map_key for map_key in _MAP_KEY_ORDER if map_key in map_keys
+        )
         self._map: dict[Hashable, Product] | None = None
 
     def _get_specificity(self, product: Product) -> tuple[int, ...]:
@@ -135,19 +161,59 @@ class ProductMatcher(Matcher[ProductItem, Product]):
                 return candidate.generic
         return super().select_duplicate(candidate, duplicate)
 
-    def _propose(
-        self, product: Product, item: ProductItem
-    ) -> Iterator[tuple[Product, ProductItem]]:
-        if self.match(product, item):
-            yield product, item
+    @staticmethod
+    def _get_extra_shops(
+        extra: Collection[Product],
+    ) -> dict[str, list[Product]]:
+        # Group extra candidates by the shops of themselves or their ranges
+        shops: dict[str, list[Product]] = {}
+        for product in extra:
+            for shop in {product.shop, *(sub.shop for sub in product.range)}:
+                shops.setdefault(shop, []).append(product)
+        return shops
 
     def _propose_extra(
-        self, item: ProductItem, extra: Collection[Product]
+        self,
+        item: ProductItem,
+        extra: Collection[Product],
+        bonuses: AbstractSet[str],
     ) -> Iterator[tuple[Product, ProductItem]]:
         for product in extra:
-            yield from self._propose(product, item)
+            if self._match(product, item, bonuses):
+                yield product, item
             for product_range in product.range:
-                yield from self._propose(product_range, item)
+                if self._match(product_range, item, bonuses):
+                    yield product_range, item
+
+    def _propose_rows(
+        self, rows: Iterable[_CandidateRow], extra: Collection[Product]
+    ) -> Iterator[tuple[Product, ProductItem]]:
+        # Rows are ordered by item, so the discount labels of each item are
+        # collected once and its extra candidates are proposed once
+        extra_shops = self._get_extra_shops(extra)
+        extra_ids = {
+            product.id
+            for product in extra
+            if cast(int | None, product.id) is not None
+        }
+        previous: ProductItem | None = None
+        bonuses: AbstractSet[str] = frozenset()
+        for row in rows:
+            item = row.ProductItem
+            new = item is not previous
+            if new:
+                previous = item
+                bonuses = self._get_bonuses(item)
+            if (
+                cast(Product | None, row.Product) is not None
+                and row.Product.id not in extra_ids
+                and self._match(row.Product, item, bonuses)
+            ):
+                yield row.Product, item
+            if new:
+                yield from self._propose_extra(
+                    item, extra_shops.get(item.receipt.shop, []), bonuses
+                )
 
     def _build_dirty_product_candidate_query(
         self,
@@ -218,6 +284,21 @@ class ProductMatcher(Matcher[ProductItem, Product]):
 
         return query
 
+    @staticmethod
+    def _get_buckets(products: Sequence[Product]) -> _Buckets:
+        buckets: _Buckets = {}
+        for index, product in enumerate(products):
+            names: set[str | None] = {None}
+            if product.labels and not any(
+                label.is_pattern for label in product.labels
+            ):
+                names = {label.name for label in product.labels}
+            for name in names:
+                buckets.setdefault((product.shop, name), []).append(
+                    (index, product)
+                )
+        return buckets
+
     def _find_dirty_candidates(
         self,
         session: Session,
@@ -228,12 +309,22 @@ class ProductMatcher(Matcher[ProductItem, Product]):
         query = self._build_dirty_product_candidate_query(items, extra)
         LOGGER.debug("%s", query)
         products = session.scalars(query).unique().all()
+        buckets = self._get_buckets(products)
+        extra_shops = self._get_extra_shops(extra)
         for item in items:
             if only_unmatched and item.product_id is not None:
                 continue
-            for product in products:
-                yield from self._propose(product, item)
-            yield from self._propose_extra(item, extra)
+            shop = item.receipt.shop
+            bonuses = self._get_bonuses(item)
+            for _, product in heapq.merge(
+                buckets.get((shop, item.label), []),
+                buckets.get((shop, None), []),
+            ):
+                if self._match(product, item, bonuses):
+                    yield product, item
+            yield from self._propose_extra(
+                item, extra_shops.get(shop, []), bonuses
+            )
 
     @override
     def find_candidates(
@@ -243,33 +334,59 @@ class ProductMatcher(Matcher[ProductItem, Product]):
         extra: Collection[Product] = (),
         only_unmatched: bool = False,
     ) -> Iterator[tuple[Product, ProductItem]]:
-        if any(
-            cast(int | None, item.id) is None or item in session.dirty
-            for item in items
-        ):
+        collected = self._collect_items(session, items)
+        if collected is None:
             yield from self._find_dirty_candidates(
                 session, items, extra, only_unmatched
             )
             return
 
-        query: Select[_Row] = self._build_query(items, extra, only_unmatched)
+        ids, shop = collected
+        query = self._get_query(
+            bool(items), bool(extra), only_unmatched, shop is not None
+        )
         LOGGER.debug("%s", query)
-        seen: set[ProductItem] = set()
-        extra_ids = {
-            product.id
-            for product in extra
-            if cast(int | None, product.id) is not None
-        }
-        result = cast(Iterator[_CandidateRow], iter(session.execute(query)))
-        for row in result:
-            if (
-                cast(Product | None, row.Product) is not None
-                and row.Product.id not in extra_ids
-            ):
-                yield from self._propose(row.Product, row.ProductItem)
-            if row.ProductItem not in seen:
-                seen.add(row.ProductItem)
-                yield from self._propose_extra(row.ProductItem, extra)
+        batches: Iterable[_Parameters] = (
+            self._get_item_batches(ids, shop) if items else ({},)
+        )
+        rows = chain.from_iterable(
+            cast(Iterator[_CandidateRow], iter(session.execute(query, batch)))
+            for batch in batches
+        )
+        yield from self._propose_rows(rows, extra)
+
+    @staticmethod
+    def _collect_items(
+        session: Session, items: Collection[ProductItem]
+    ) -> tuple[list[int], str | None] | None:
+        # Collect the item IDs and their shop if they all have the same one,
+        # or nothing if any item is new or dirty
+        ids: list[int] = []
+        shops: set[str] = set()
+        dirty = session.dirty
+        for item in items:
+            item_id = cast(int | None, item.id)
+            if item_id is None or item in dirty:
+                return None
+            ids.append(item_id)
+            shops.add(item.receipt.shop)
+
+        return ids, shops.pop() if len(shops) == 1 else None
+
+    @staticmethod
+    def _get_item_batches(
+        ids: list[int], shop: str | None
+    ) -> Iterator[_Parameters]:
+        # Limit the number of bound parameters per query, with batches in
+        # ascending order so that results remain ordered by item
+        ids = sorted(ids)
+        for start in range(0, len(ids), _ITEM_BATCH_SIZE):
+            parameters: _Parameters = {
+                "items": ids[start : start + _ITEM_BATCH_SIZE]
+            }
+            if shop is not None:
+                parameters["shop"] = shop
+            yield parameters
 
     def _get_query_matchers(
         self, query: QT
@@ -308,19 +425,52 @@ class ProductMatcher(Matcher[ProductItem, Product]):
             query = query.join(DiscountMatch, Product.discounts, isouter=True)
         return query, minimum, maximum, other
 
-    def _build_query(
+    def _get_matcher_filter(
         self,
-        items: Collection[ProductItem],
-        extra: Collection[Product],
-        only_unmatched: bool,
+        minimum: type[PriceMatch],
+        maximum: type[PriceMatch],
+        other: type[PriceMatch],
+    ) -> ColumnElement[bool]:
+        # Prune products without any matchers before joining items, since
+        # they never match; the discount matchers are only joined if enabled
+        return or_(
+            LabelMatch.id.is_not(None),
+            other.id.is_not(None),
+            minimum.id.is_not(None),
+            maximum.id.is_not(None),
+            DiscountMatch.id.is_not(None)
+            if self.discounts
+            else Product.discounts.any(),
+        )
+
+    def _get_query(
+        self, items: bool, extra: bool, only_unmatched: bool, shop: bool
+    ) -> Select[_Row]:
+        shape = (items, extra, only_unmatched, self.discounts, shop)
+        if shape not in self._queries:
+            self._queries[shape] = self._build_query(
+                items, extra, only_unmatched, shop
+            )
+        return self._queries[shape]
+
+    def _build_query(
+        self, items: bool, extra: bool, only_unmatched: bool, shop: bool
     ) -> Select[_Row]:
+        # The query is built once for each shape and reused, with the IDs of
+        # the items and their single shop provided as parameters upon execution
         query = select(ProductItem, Product)
         if extra:
             query = query.select_from(ProductItem).join(
-                Product, literal(value=True), isouter=True
+                Product,
+                Product.shop == bindparam("shop")
+                if shop
+                else literal(value=True),
+                isouter=True,
             )
         else:
             query = query.select_from(Product)
+            if shop:
+                query = query.filter(Product.shop == bindparam("shop"))
         query, minimum, maximum, other = self._get_query_matchers(query)
         item_join = and_(
             or_(
@@ -350,7 +500,9 @@ class ProductMatcher(Matcher[ProductItem, Product]):
         if extra:
             query = query.filter(item_join)
         else:
-            query = query.join(ProductItem, item_join)
+            query = query.join(ProductItem, item_join).filter(
+                self._get_matcher_filter(minimum, maximum, other)
+            )
         query = query.join(
             Receipt,
             ProductItem.receipt.and_(
@@ -375,9 +527,18 @@ class ProductMatcher(Matcher[ProductItem, Product]):
                 isouter=True,
             ).join(Discount, discount_join, isouter=True)
         if items:
-            query = query.filter(ProductItem.id.in_(item.id for item in items))
+            query = query.filter(
+                ProductItem.id.in_(bindparam("items", expanding=True))
+            )
         if only_unmatched:
             query = query.filter(ProductItem.product_id.is_(None))
+        # Provide each pair of item and product once, regardless of how many
+        # of their matchers and discounts joined, and fill the receipt of items
+        # from the join while loading their discounts for matching
+        query = query.distinct().options(
+            contains_eager(ProductItem.receipt),
+            selectinload(ProductItem.discounts),
+        )
         return query.order_by(
             ProductItem.id, Product.generic_id.asc().nulls_first(), Product.id
         )
@@ -390,52 +551,86 @@ class ProductMatcher(Matcher[ProductItem, Product]):
         return label.name == name
 
     @classmethod
-    def _match_price(cls, price: PriceMatch, item: ProductItem) -> int:
-        if item.quantity.unit is not None:
+    def _get_unit_price(cls, price: PriceMatch) -> Quantity | None:
+        # Parsing the unit is costly, so reuse quantities of price matchers
+        # with the same value and indicator across items
+        key = (price.value, price.indicator)
+        if key not in cls._unit_prices:
             try:
-                quantity = Quantity(price.value, unit=f"1 / {price.indicator}")
-                if quantity * item.quantity == item.price:
-                    return 1
+                cls._unit_prices[key] = Quantity(
+                    price.value, unit=f"1 / {price.indicator}"
+                )
             except ValueError:
-                pass
+                cls._unit_prices[key] = None
+
+        return cls._unit_prices[key]
+
+    @classmethod
+    def _get_dates(cls, receipt_date: date) -> tuple[str, str]:
+        # Reuse the year and month indicators of receipts from the same date
+        if receipt_date not in cls._dates:
+            year = str(receipt_date.year)
+            cls._dates[receipt_date] = (
+                year,
+                f"{year}-{receipt_date.month:0>2}",
+            )
+
+        return cls._dates[receipt_date]
+
+    @classmethod
+    def _match_price(
+        cls,
+        price: PriceMatch,
+        quantity: Quantity,
+        item_price: Price,
+        dates: tuple[str, str],
+    ) -> int:
+        if quantity.unit is not None:
+            unit_price = cls._get_unit_price(price)
+            if unit_price is not None and unit_price * quantity == item_price:
+                return 1
 
             return 0
 
-        match_price = Quantity(price.value) * item.quantity
-        if (
-            price.indicator == Indicator.MINIMUM and match_price <= item.price
-        ) or (
-            price.indicator == Indicator.MAXIMUM and match_price >= item.price
-        ):
-            return 1
-        if price.indicator in {Indicator.MINIMUM, Indicator.MAXIMUM}:
-            return -1
+        # Multiply the decimal magnitude directly, as a dimensionless Pint
+        # quantity would do, without constructing quantities
+        match_price = price.value * quantity.value.magnitude
+        if price.indicator == _MINIMUM:
+            return 1 if match_price <= item_price else -1
+        if price.indicator == _MAXIMUM:
+            return 1 if match_price >= item_price else -1
 
         if (
-            price.indicator is None
-            or price.indicator == str(item.receipt.date.year)
-            or price.indicator
-            == f"{item.receipt.date.year}-{item.receipt.date.month:0>2}"
-        ) and match_price == item.price:
+            price.indicator is None or price.indicator in dates
+        ) and match_price == item_price:
             return 1
 
         return 0
 
     @staticmethod
-    def _match_discount(discount: DiscountMatch, item: ProductItem) -> bool:
-        pattern = re.compile(discount.label) if discount.is_pattern else None
-        return any(
-            discount.label == bonus.label
-            if pattern is None
-            else pattern.match(bonus.label)
-            for bonus in item.discounts
-        )
+    def _match_discount(
+        discount: DiscountMatch, bonuses: AbstractSet[str]
+    ) -> bool:
+        if discount.is_pattern:
+            pattern = re.compile(discount.label)
+            return any(pattern.match(bonus) for bonus in bonuses)
+        return discount.label in bonuses
+
+    @staticmethod
+    def _get_bonuses(item: ProductItem) -> AbstractSet[str]:
+        return frozenset(bonus.label for bonus in item.discounts)
 
     @override
     def match(self, candidate: Product, item: ProductItem) -> bool:
+        return self._match(candidate, item, self._get_bonuses(item))
+
+    def _match(
+        self, candidate: Product, item: ProductItem, bonuses: AbstractSet[str]
+    ) -> bool:
         # Candidate must be from the same shop and have at least one matcher
         # Currently, candidate must be generic instead of from a product range
-        if candidate.shop != item.receipt.shop or (
+        receipt = item.receipt
+        if candidate.shop != receipt.shop or (
             not candidate.labels
             and not candidate.prices
             and not candidate.discounts
@@ -450,8 +645,15 @@ class ProductMatcher(Matcher[ProductItem, Product]):
             return False
 
         seen_price = 0
-        for price in candidate.prices:
-            seen_price += self._match_price(price, item)
+        if candidate.prices:
+            # Read item fields once for all the price matchers
+            quantity = item.quantity
+            item_price = item.price
+            dates = self._get_dates(receipt.date)
+            for price in candidate.prices:
+                seen_price += self._match_price(
+                    price, quantity, item_price, dates
+                )
         # Must adhere to both 'minimum' and 'maximum' (or either if only one),
         # one date indicator, one unit indicator or one with no indicator.
         # No price matchers is also acceptable.
@@ -461,10 +663,10 @@ class ProductMatcher(Matcher[ProductItem, Product]):
         # Final match check with discounts, one matching discount is enough.
         # No discount matcher is accepted, and so is an item without discounts
         # when the discount matching mode is disabled.
-        if not candidate.discounts or not (self.discounts or item.discounts):
+        if not candidate.discounts or not (self.discounts or bonuses):
             return True
         for discount in candidate.discounts:
-            if self._match_discount(discount, item):
+            if self._match_discount(discount, bonuses):
                 return True
 
         return False
@@ -482,18 +684,17 @@ class ProductMatcher(Matcher[ProductItem, Product]):
 
     @override
     def get_keys(self, product: Product) -> Iterator[Key]:
-        keys = (
-            (MapKey.MAP_MATCH, self._get_product_match(product)),
-            (MapKey.MAP_SKU, (product.shop, product.sku)),
-            (MapKey.MAP_GTIN, (product.shop, product.gtin)),
-        )
-        return (
-            (map_key, match)
-            for map_key, match in keys
-            if map_key in self._map_keys
-            and match is not None
-            and match[-1] is not None
-        )
+        # Keys are constructed lazily and only for the enabled map keys, such
+        # that lookups stop early. The identifiers come first, since they are
+        # cheap to build and skip building the matcher tuples upon a hit.
+        for map_key in self._map_keys:
+            match: MapMatch | None
+            if map_key is MapKey.MAP_MATCH:
+                match = self._get_product_match(product)
+            else:
+                match = (product.shop, getattr(product, map_key.value))
+            if match is not None and match[-1] is not None:
+                yield map_key, match
 
     def _build_candidate_query(
         self, exclude: Collection[Product] = ()
@@ -7,7 +7,7 @@ from enum import Enum
 from itertools import zip_longest
 from typing import Any, TypeVar, cast, final
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import (
     MappedColumn,
     Relationship,
@@ -46,6 +46,9 @@ class Product(Base):
     """
 
     __tablename__ = "product"
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_product_shop_generic_id", "shop", "generic_id", "id"),
+    )
 
     id: MappedColumn[int] = mapped_column(primary_key=True, autoincrement=True)
     shop: MappedColumn[str] = mapped_column(ForeignKey("shop.key"))
@@ -62,6 +65,7 @@ class Product(Base):
         back_populates="product",
         cascade=_CASCADE_OPTIONS,
         passive_deletes=True,
+        order_by="PriceMatch.id",
         lazy="selectin",
     )
     discounts: Relationship[list["DiscountMatch"]] = relationship(
@@ -115,9 +119,8 @@ class Product(Base):
         self.prices = []
         self.discounts = []
         self.range = []
-        for column, meta in self.__table__.c.items():
-            if cast(bool, meta.nullable) and not meta.foreign_keys:
-                setattr(self, column, None)
+        for column in _CLEARABLE_FIELDS:
+            setattr(self, column, None)
 
         # Obtain inherited default properties
         if self.generic is not None:
@@ -173,6 +176,35 @@ class Product(Base):
         ):
             product_range.check_merge(other_range)
 
+    def _merge_labels(self, other: "Product") -> bool:
+        # Only collect existing matchers if the other product has any to add
+        if not other.labels:
+            return False
+
+        changed = False
+        labels = {label.name for label in self.labels}
+        for label in other.labels:
+            if label.name not in labels:
+                LOGGER.debug("Adding label matcher %s", label.name)
+                self.labels.append(LabelMatch(name=label.name))
+                changed = True
+
+        return changed
+
+    def _merge_discounts(self, other: "Product") -> bool:
+        if not other.discounts:
+            return False
+
+        changed = False
+        discounts = {discount.label for discount in self.discounts}
+        for discount in other.discounts:
+            if discount.label not in discounts:
+                LOGGER.debug("Adding discount matcher %r", discount.label)
+                self.discounts.append(DiscountMatch(label=discount.label))
+                changed = True
+
+        return changed
+
     def _merge_range(self, other: "Product", replace: bool = True) -> bool:
         changed = False
         if self.generic is None:
@@ -219,7 +251,7 @@ class Product(Base):
 
     def _merge_fields(self, other: "Product", replace: bool = True) -> bool:
         changed = False
-        for column, meta in self.__table__.c.items():
+        for column, meta in _COLUMNS:
             changed = (
                 self._merge_field(
                     column,
@@ -365,24 +397,17 @@ class Product(Base):
         self.check_merge(other)
 
         LOGGER.debug("Performing merge into %r from %r", self, other)
-        changed = False
-        labels = {label.name for label in self.labels}
-        for label in other.labels:
-            if label.name not in labels:
-                LOGGER.debug("Adding label matcher %s", label.name)
-                self.labels.append(LabelMatch(name=label.name))
-                changed = True
+        changed = self._merge_labels(other)
 
-        indicators, plain = self._make_price_indicators()
-        for price in other.prices:
-            changed, plain = self._merge_price(other, price, indicators, plain)
+        if other.prices:
+            indicators, plain = self._make_price_indicators()
+            for price in other.prices:
+                changed, plain = self._merge_price(
+                    other, price, indicators, plain
+                )
 
-        discounts = {discount.label for discount in self.discounts}
-        for discount in other.discounts:
-            if discount.label not in discounts:
-                LOGGER.debug("Adding discount matcher %r", discount.label)
-                self.discounts.append(DiscountMatch(label=discount.label))
-                changed = True
+        if self._merge_discounts(other):
+            changed = True
 
         if self._merge_range(other, replace=replace):
             changed = True
@@ -422,6 +447,15 @@ class Product(Base):
         )
 
 
+# Column names and metadata of products, and nullable non-reference columns
+_COLUMNS = tuple(Product.__table__.c.items())
+_CLEARABLE_FIELDS = tuple(
+    column
+    for column, meta in _COLUMNS
+    if cast(bool, meta.nullable) and not meta.foreign_keys
+)
+
+
 class Match:  # pylint: disable=too-few-public-methods
     """
     Model that matches a field of a product.
@@ -468,6 +502,13 @@ class PriceMatch(Base, Match):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "product_price_match"
+    __table_args__: tuple[Index, ...] = (
+        Index(
+            "ix_product_price_match_product_indicator",
+            "product_id",
+            "indicator",
+        ),
+    )
 
     id: MappedColumn[int] = mapped_column(primary_key=True)
     product_id: MappedColumn[int] = mapped_column(
@@ -6,7 +6,7 @@ import datetime
 import re
 from typing import final
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, inspect
 from sqlalchemy.orm import (
     MappedColumn,
     Relationship,
@@ -77,6 +77,9 @@ class DiscountItems(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "receipt_discount_products"
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_receipt_discount_products_product", "product_id"),
+    )
 
     discount_id: MappedColumn[int] = mapped_column(
         "discount_id",
@@ -97,6 +100,10 @@ class ProductItem(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "receipt_product"
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_receipt_product_receipt_position", "receipt_key", "position"),
+        Index("ix_receipt_product_product", "product_id"),
+    )
 
     id: MappedColumn[int] = mapped_column(primary_key=True)
     receipt_key: MappedColumn[str] = mapped_column(
@@ -159,6 +166,11 @@ class Discount(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "receipt_discount"
+    __table_args__: tuple[Index, ...] = (
+        Index(
+            "ix_receipt_discount_receipt_position", "receipt_key", "position"
+        ),
+    )
 
     id: MappedColumn[int] = mapped_column(primary_key=True)
     receipt_key: MappedColumn[str] = mapped_column(
@@ -177,8 +189,13 @@ class Discount(Base):  # pylint: disable=too-few-public-methods
 
     @override
     def __repr__(self) -> str:
+        # Avoid loading the items from the database for the representation
+        state = inspect(self)
+        if state.has_identity and "items" in state.unloaded:
+            items = "..."
+        else:
+            items = repr([item.label for item in self.items])
         return (
             f"Discount(receipt={self.receipt_key!r}, label={self.label!r}, "
-            f"price_decrease={self.price_decrease!s}, "
-            f"items={[item.label for item in self.items]!r})"
+            f"price_decrease={self.price_decrease!s}, items={items})"
         )
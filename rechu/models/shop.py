@@ -5,7 +5,7 @@ Models for shop metadata.
 import logging
 from typing import cast, final
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import (
     MappedColumn,
     Relationship,
@@ -87,22 +87,34 @@ class Shop(Base):
                 setattr(self, field, target)
                 changed = True
 
-        patterns = [indicator.pattern for indicator in self.discount_indicators]
-        other_patterns = [
-            indicator.pattern for indicator in other.discount_indicators
-        ]
-        if sorted(patterns) != sorted(other_patterns):
-            LOGGER.debug(
-                "Updating discount indicators from %r to %r",
-                patterns,
-                other_patterns,
-            )
-            self.discount_indicators = [
-                DiscountIndicator(pattern=pattern) for pattern in other_patterns
-            ]
-            changed = True
-
-        return changed
+        return self._merge_discount_indicators(other) or changed
+
+    def _merge_discount_indicators(self, other: "Shop") -> bool:
+        # Only remove and add the indicators with different patterns, keeping
+        # the existing indicators rather than replacing all of them
+        current = {
+            indicator.pattern: indicator
+            for indicator in self.discount_indicators
+        }
+        patterns = {
+            indicator.pattern: None for indicator in other.discount_indicators
+        }
+        if current.keys() == patterns.keys():
+            return False
+
+        LOGGER.debug(
+            "Updating discount indicators from %r to %r",
+            list(current),
+            list(patterns),
+        )
+        for pattern in current.keys() - patterns.keys():
+            self.discount_indicators.remove(current[pattern])
+        self.discount_indicators.extend(
+            DiscountIndicator(pattern=pattern)
+            for pattern in patterns
+            if pattern not in current
+        )
+        return True
 
     @override
     def __repr__(self) -> str:
@@ -122,6 +134,9 @@ class DiscountIndicator(Base):  # pylint: disable=too-few-public-methods
     """
 
     __tablename__ = "shop_discount_indicator"
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_shop_discount_indicator_shop", "shop_id"),
+    )
 
     id: MappedColumn[int] = mapped_column(primary_key=True)
     shop_id: MappedColumn[int] = mapped_column(
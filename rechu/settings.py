@@ -19,6 +19,7 @@ class _SettingsFile(TypedDict, total=False):
 
 
 _Chain = tuple[_SettingsFile, ...]
+_ChainKey = tuple[tuple[str | os.PathLike[str], bool, tuple[str, ...]], ...]
 _Section = Table | tomlkit.TOMLDocument
 _SectionComments = dict[str, list[str]]
 _DocumentComments = dict[str, _SectionComments]
@@ -35,12 +36,23 @@ FILES: _Chain = (
 )
 
 
+def _get_key(fallbacks: _Chain) -> _ChainKey:
+    return tuple(
+        (file["path"], file.get("environment", True), file.get("prefix", ()))
+        for file in fallbacks
+    )
+
+
+_FILES_KEY = _get_key(FILES)
+
+
 class Settings:
     """
     Settings reader and provider.
     """
 
-    _files: ClassVar[dict[int, "Settings"]] = {}
+    _files: ClassVar[dict[_ChainKey, "Settings"]] = {}
+    _env_names: ClassVar[dict[tuple[str, str], str]] = {}
 
     @classmethod
     def get_settings(cls) -> "Settings":
@@ -48,11 +60,10 @@ class Settings:
         Retrieve the settings singleton.
         """
 
-        return cls._get_fallback(FILES)
+        return cls._get_fallback(FILES, _FILES_KEY)
 
     @classmethod
-    def _get_fallback(cls, fallbacks: _Chain) -> "Settings":
-        key = hash(tuple(tuple(file.values()) for file in fallbacks))
+    def _get_fallback(cls, fallbacks: _Chain, key: _ChainKey) -> "Settings":
         if key not in cls._files:
             cls._files[key] = cls(fallbacks=fallbacks[1:], **fallbacks[0])
 
@@ -104,6 +115,11 @@ class Settings:
         self.environment: bool = environment
         self.fallbacks: _Chain = fallbacks
         self.prefix: tuple[str, ...] = prefix
+        self._fallback_key: _ChainKey = _get_key(fallbacks)
+        self._values: dict[tuple[str, str], str] = {}
+
+    def _get_next(self) -> "Settings":
+        return self._get_fallback(self.fallbacks, self._fallback_key)
 
     def get(self, section: str, key: str) -> str:
         """
@@ -112,18 +128,29 @@ class Settings:
         potentially with an environment variable override.
         """
 
-        env_name = f"RECHU_{section.upper()}_{key.upper().replace('-', '_')}"
-        if self.environment and env_name in os.environ:
-            return os.environ[env_name]
-        try:
-            group = self.sections[section]
-        except KeyError:
-            group = None
-        if not isinstance(group, dict) or key not in group:
-            if self.fallbacks:
-                return self._get_fallback(self.fallbacks).get(section, key)
-            raise KeyError(f"{section} is not a section or does not have {key}")
-        return str(group[key])
+        name = (section, key)
+        if self.environment:
+            if name not in self._env_names:
+                self._env_names[name] = (
+                    f"RECHU_{section.upper()}_{key.upper().replace('-', '_')}"
+                )
+            env_name = self._env_names[name]
+            if env_name in os.environ:
+                return os.environ[env_name]
+        # Values from the file do not change, so only look them up once
+        if name not in self._values:
+            try:
+                group = self.sections[section]
+            except KeyError:
+                group = None
+            if not isinstance(group, dict) or key not in group:
+                if self.fallbacks:
+                    return self._get_next().get(section, key)
+                raise KeyError(
+                    f"{section} is not a section or does not have {key}"
+                )
+            self._values[name] = str(group[key])
+        return self._values[name]
 
     @staticmethod
     def _get_section_comments(
@@ -153,7 +180,7 @@ class Settings:
 
         comments: _DocumentComments = {}
         if self.fallbacks:
-            comments = self._get_fallback(self.fallbacks).get_comments()
+            comments = self._get_next().get_comments()
         for table in self.sections:
             section = self.sections[table]
             # Keep default comments over comments later in chain
@@ -191,7 +218,7 @@ class Settings:
         """
 
         if self.fallbacks:
-            document = self._get_fallback(self.fallbacks).get_document()
+            document = self._get_next().get_document()
         else:
             document = tomlkit.document()
 
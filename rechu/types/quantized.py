@@ -36,6 +36,9 @@ class Price(Decimal):  # pylint: disable=too-few-public-methods
         Create the price from a decimal, number or string representation.
         """
 
+        # Prices already have the scale, so skip converting and quantizing
+        if isinstance(value, Price):
+            return super().__new__(cls, value)
         try:
             return super().__new__(cls, Decimal(value).quantize(cls._quantize))
         except ArithmeticError as e:
@@ -130,7 +130,8 @@ class DatabaseTest(DatabaseTestCase):
     @patch_settings({"RECHU_DATABASE_URI": "sqlite+pysqlite:///example.db"})
     def test_set_sqlite_pragma(self) -> None:
         """
-        Test whether the SQLite dialect is set to enable foreign keys.
+        Test whether the SQLite dialect is set to enable foreign keys and the
+        configured journal mode.
         """
 
         Settings.clear()
@@ -138,14 +139,24 @@ class DatabaseTest(DatabaseTestCase):
         database = Database()
         with database as session:
             self.assertTrue(session.scalar(text("PRAGMA foreign_keys")))
+            self.assertEqual(session.scalar(text("PRAGMA journal_mode")), "wal")
+            self.assertEqual(session.scalar(text("PRAGMA synchronous")), 1)
 
         database.clear()
         Settings.clear()
 
-        with patch_settings({"RECHU_DATABASE_FOREIGN_KEYS": "off"}):
+        with patch_settings(
+            {
+                "RECHU_DATABASE_FOREIGN_KEYS": "off",
+                "RECHU_DATABASE_JOURNAL_MODE": "delete",
+            }
+        ):
             database = Database()
             with database as session:
                 self.assertFalse(session.scalar(text("PRAGMA foreign_keys")))
+                self.assertEqual(
+                    session.scalar(text("PRAGMA journal_mode")), "delete"
+                )
 
         database.clear()
         Settings.clear()
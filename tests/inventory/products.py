@@ -72,6 +72,11 @@ class ProductsTest(DatabaseTestCase):
                 re.compile(pattern),
             ),
         )
+        # Parts are cached per path format.
+        settings = Settings.get_settings()
+        self.assertIs(
+            Products.get_parts(settings), Products.get_parts(settings)
+        )
 
         Settings.clear()
 
@@ -478,7 +483,10 @@ class ProductsTest(DatabaseTestCase):
         self.assertEqual(inv.shop, "inv")
         self.assertEqual(inv.gtin, 9876543210321)
 
-        _ = self.inventory.merge_update(self.other)
         key = (MapKey.MAP_GTIN, ("other", 1234567890123))
         self.assertIsNot(self.inventory.find(key), self.portions)
+
+        # New products from a merge update are added to the map directly.
+        _ = self.inventory.merge_update(self.other)
+        self.assertIs(self.inventory.find(key), self.portions)
         self.assertIs(self.inventory.find(key, update_map=True), self.portions)
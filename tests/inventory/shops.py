@@ -302,12 +302,14 @@ class ShopsTest(DatabaseTestCase):
         self.assertEqual(inv.key, "inv")
         self.assertEqual(inv.name, "Inventory")
 
-        _ = self.inventory.merge_update(self.extra)
         found = self.inventory.find("other")
         self.assertIsNot(found, self.other)
         self.assertEqual(found.key, "other")
         self.assertIsNone(found.name)
 
+        # New shops from a merge update are added to the map directly.
+        _ = self.inventory.merge_update(self.extra)
+        self.assertIs(self.inventory.find("other"), self.other)
         self.assertIs(self.inventory.find("other", update_map=True), self.other)
 
         with self.assertRaisesRegex(
@@ -94,3 +94,13 @@ class WriterTest(unittest.TestCase):
 
         with self.assertRaises(NotImplementedError):
             self.writer.serialize(StringIO(""))
+
+    def test_write(self) -> None:
+        """
+        Test writing the models to the path.
+        """
+
+        with self.assertRaises(NotImplementedError):
+            self.writer.write()
+        self.assertFalse(self.writer.path.exists())
+        self.assertEqual(list(Path("samples").glob(".entity.yml.*.tmp")), [])
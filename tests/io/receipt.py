@@ -2,12 +2,15 @@
 Tests for receipt file handling.
 """
 
+import stat
 import unittest
 from datetime import date, datetime
 from io import StringIO
 from itertools import zip_longest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import cast, final
+from unittest.mock import patch
 
 import yaml
 from typing_extensions import TypedDict, override
@@ -96,6 +99,18 @@ class ReceiptReaderTest(unittest.TestCase):
     Tests for receipt file reader.
     """
 
+    def test_read_uncached(self) -> None:
+        """
+        Test reading a receipt file multiple times without reusing loaded data.
+        """
+
+        path = Path("samples/receipt.yml")
+        with patch("rechu.io.base.yaml.load", wraps=yaml.load) as load:
+            first = next(ReceiptReader(path).read())
+            second = next(ReceiptReader(path).read())
+            self.assertIsNot(first, second)
+            self.assertEqual(load.call_count, 2)
+
     def test_parse(self) -> None:
         """
         Test parsing an open file and yielding receipt models from it.
@@ -337,3 +352,35 @@ class ReceiptWriterTest(unittest.TestCase):
         writer = ReceiptWriter(path, (self.model,), updated=now)
         writer.write()
         self.assertEqual(path.stat().st_mtime, now.timestamp())
+
+    def test_write_symlink(self) -> None:
+        """
+        Test writing a model through a symbolic link to an existing file and
+        to a new file, with the permissions kept or based on the umask.
+        """
+
+        with TemporaryDirectory() as directory:
+            target = Path(directory) / "receipt.yml"
+            target.touch(mode=0o640)
+            target.chmod(0o640)
+            path = Path(directory) / "link.yml"
+            path.symlink_to(target.name)
+
+            ReceiptWriter(path, (self.model,)).write()
+            self.assertTrue(path.is_symlink())
+            self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+            self.assertNotEqual(target.stat().st_size, 0)
+            self.assertEqual(
+                sorted(file.name for file in Path(directory).iterdir()),
+                ["link.yml", "receipt.yml"],
+            )
+
+            # New files receive the permissions from the umask
+            reference = Path(directory) / "reference.yml"
+            reference.touch()
+            new_path = Path(directory) / "new.yml"
+            ReceiptWriter(new_path, (self.model,)).write()
+            self.assertEqual(
+                stat.S_IMODE(new_path.stat().st_mode),
+                stat.S_IMODE(reference.stat().st_mode),
+            )
@@ -7,6 +7,7 @@ from io import StringIO
 from itertools import zip_longest
 from pathlib import Path
 from typing import cast, final
+from unittest.mock import patch
 
 import yaml
 from typing_extensions import Required, TypedDict, override
@@ -89,6 +90,34 @@ class ShopsReaderTest(unittest.TestCase):
                     with self.assertRaisesRegex(TypeError, pattern):
                         self.assertIsNone(next(reader.parse(file)))
 
+    def test_read_cached(self) -> None:
+        """
+        Test reading a file multiple times, reusing loaded data as long as the
+        file is unchanged while providing new models.
+        """
+
+        ShopsReader.clear_cache()
+        self.addCleanup(ShopsReader.clear_cache)
+        path = Path("samples/shops-cached.yml")
+        self.addCleanup(path.unlink, missing_ok=True)
+        _ = path.write_text("- key: id\n", encoding="utf-8")
+        with patch("rechu.io.base.yaml.load", wraps=yaml.load) as load:
+            first = list(ShopsReader(path).read())
+            second = list(ShopsReader(path).read())
+            self.assertEqual([shop.key for shop in second], ["id"])
+            self.assertIsNot(first[0], second[0])
+            self.assertEqual(load.call_count, 1)
+
+            _ = path.write_text("- key: other\n", encoding="utf-8")
+            third = list(ShopsReader(path).read())
+            self.assertEqual([shop.key for shop in third], ["other"])
+            self.assertEqual(load.call_count, 2)
+
+            ShopsReader.clear_cache()
+            fourth = list(ShopsReader(path).read())
+            self.assertEqual([shop.key for shop in fourth], ["other"])
+            self.assertEqual(load.call_count, 3)
+
 
 @final
 class ShopsWriterTest(unittest.TestCase):
@@ -7,7 +7,7 @@ from datetime import date
 from decimal import Decimal
 from pathlib import Path
 from typing import final
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
@@ -239,6 +239,29 @@ class ProductMatcherTest(DatabaseTestCase):
                 [(products[2], items[1]), (products[2].range[1], items[1])],
             )
 
+    def test_find_candidates_batches(self) -> None:
+        """
+        Test detecting candidate products in the database that match the items
+        when the items are provided in multiple batches.
+        """
+
+        with self.database as session:
+            products, receipt = self._load_samples(session)
+            items = receipt.products
+            matcher = ProductMatcher()
+            with patch("rechu.matcher.product._ITEM_BATCH_SIZE", 2):
+                self.assertEqual(
+                    list(matcher.find_candidates(session, items[::-1])),
+                    [
+                        (products[2], items[1]),
+                        (products[2].range[1], items[1]),
+                        (products[2], items[3]),
+                        (products[2].range[0], items[3]),
+                        (products[0], items[4]),
+                        (products[1], items[5]),
+                    ],
+                )
+
     def test_find_candidates_extra(self) -> None:
         """
         Test detecting candidate products from outside the database that match
@@ -725,6 +748,13 @@ class ProductMatcherTest(DatabaseTestCase):
         self.assertTrue(matcher.discard_map(generic))
         self.assertFalse(matcher.discard_map(generic))
 
+        # Keys under which the product was added are removed after changes
+        changed = Product(shop="id", sku="xyz789")
+        _ = matcher.add_map(changed)
+        changed.sku = "zyx987"
+        self.assertTrue(matcher.discard_map(changed))
+        self.assertIsNone(matcher.check_map(Product(shop="id", sku="xyz789")))
+
     def test_check_map(self) -> None:
         """
         Test retrieving a candidate product which has one or more unique keys.
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import final
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from rechu.io.receipt import ReceiptReader
 from rechu.models.base import Price, Quantity
@@ -234,6 +235,17 @@ class DiscountTest(DatabaseTestCase):
         with self.database as session:
             self.assertEqual(
                 repr(session.scalars(select(Discount)).first()),
+                (
+                    "Discount(receipt='file', label='disco', "
+                    "price_decrease=-2.00, items=...)"
+                ),
+            )
+            self.assertEqual(
+                repr(
+                    session.scalars(
+                        select(Discount).options(selectinload(Discount.items))
+                    ).first()
+                ),
                 (
                     "Discount(receipt='file', label='disco', "
                     "price_decrease=-2.00, items=['bulk'])"
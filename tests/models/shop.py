@@ -73,6 +73,18 @@ class ShopTest(unittest.TestCase):
 
         self.assertFalse(self.shop.merge(self.other))
 
+        indicator = self.shop.discount_indicators[1]
+        self.other.discount_indicators = [
+            DiscountIndicator(pattern=r"\d+%"),
+            DiscountIndicator(pattern=r"[A-Z]+"),
+        ]
+        self.assertTrue(self.shop.merge(self.other))
+        self.assertEqual(
+            [ind.pattern for ind in self.shop.discount_indicators],
+            [r"\d+%", r"[A-Z]+"],
+        )
+        self.assertIs(self.shop.discount_indicators[0], indicator)
+
         with self.assertRaisesRegex(ValueError, "shops must have the same key"):
             self.assertFalse(self.shop.merge(self.inv))
 
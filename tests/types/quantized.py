@@ -44,6 +44,7 @@ class PriceTest(unittest.TestCase):
         self.assertEqual(str(Price(1.0001)), "1.00")
         self.assertEqual(str(Price(1)), "1.00")
         self.assertEqual(str(Price(Decimal("1.0"))), "1.00")
+        self.assertEqual(str(Price(Price("1.5"))), "1.50")
         with self.assertRaisesRegex(ValueError, "Could not construct .* price"):
             self.assertNotEqual(str(Price("?")), "?")
 